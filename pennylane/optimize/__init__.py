@@ -23,13 +23,13 @@ from .gradient_descent import GradientDescentOptimizer
 from .momentum import MomentumOptimizer
 from .nesterov_momentum import NesterovMomentumOptimizer
 from .rms_prop import RMSPropOptimizer
-from .qng import QNGOptimizer
+from .qng import QNGOptimizer, qng_step
 from .rotosolve import RotosolveOptimizer
 from .rotoselect import RotoselectOptimizer
 from .shot_adaptive import ShotAdaptiveOptimizer
 
 
-# Optimizers to display in the docs
+# Optimizers (and functional updates) to display in the docs
 __all__ = [
     "AdagradOptimizer",
     "AdamOptimizer",
@@ -38,6 +38,7 @@ __all__ = [
     "NesterovMomentumOptimizer",
     "RMSPropOptimizer",
     "QNGOptimizer",
+    "qng_step",
     "RotosolveOptimizer",
     "RotoselectOptimizer",
     "ShotAdaptiveOptimizer",
@@ -15,13 +15,225 @@
 # pylint: disable=too-many-branches
 # pylint: disable=too-many-arguments
 
+import weakref
+from collections.abc import Iterable
+
 import numpy as np
+from scipy.linalg import eigh, get_lapack_funcs, lstsq, lu_factor, lu_solve
 
 import pennylane as qml
-from pennylane.utils import _flatten, unflatten
 from .gradient_descent import GradientDescentOptimizer
 
 
+def _flatten_leaves(x):
+    """Iterate recursively through an arbitrarily nested structure in
+    depth-first order, yielding 1-D arrays rather than individual scalars.
+
+    Unlike :func:`pennylane.utils._flatten`, array leaves are kept whole, so
+    that the final flattening can be performed by a single C-level
+    concatenation instead of an elementwise Python loop.
+
+    Args:
+        x (array, Iterable, Any): each element of an array or an Iterable may
+            itself be any of these types
+
+    Yields:
+        array: 1-D arrays containing the leaves of ``x`` in depth-first order
+    """
+    if isinstance(x, np.ndarray):
+        yield x.ravel()
+    elif isinstance(x, Iterable) and not isinstance(x, (str, bytes)):
+        for item in x:
+            yield from _flatten_leaves(item)
+    else:
+        yield np.atleast_1d(x)
+
+
+def _fast_flatten(x):
+    """Flatten an arbitrarily nested structure of array-likes into a single
+    1-D array.
+
+    Args:
+        x (array, Iterable, Any): the structure to flatten
+
+    Returns:
+        array: 1-D array of the elements of ``x`` in depth-first order
+    """
+    if isinstance(x, np.ndarray):
+        return x.ravel()
+
+    return np.concatenate(list(_flatten_leaves(x)))
+
+
+def _capture_spec(x):
+    """Record the nested structure of ``x`` for later reconstruction.
+
+    Args:
+        x (array, Iterable, Any): the structure to capture
+
+    Returns:
+        tuple, list or None: a nested specification mirroring ``x``, where
+        array leaves are described by ``(shape, size)`` tuples, iterables by
+        lists, and scalars by ``None``
+    """
+    if isinstance(x, np.ndarray):
+        return (x.shape, x.size)
+
+    if isinstance(x, Iterable) and not isinstance(x, (str, bytes)):
+        return [_capture_spec(item) for item in x]
+
+    return None
+
+
+def _unflatten_spec(flat, spec, idx=0):
+    """Restore a nested structure from a flat array according to a
+    specification captured by :func:`_capture_spec`.
+
+    Args:
+        flat (array): 1-D array of items
+        spec (tuple, list or None): the structure specification
+        idx (int): index of the first element of ``flat`` to consume
+
+    Returns:
+        tuple: the reconstructed structure and the index of the first unused
+        element of ``flat``
+    """
+    if spec is None:
+        return flat[idx], idx + 1
+
+    if isinstance(spec, list):
+        res = []
+        for item_spec in spec:
+            val, idx = _unflatten_spec(flat, item_spec, idx)
+            res.append(val)
+        return res, idx
+
+    shape, size = spec
+    return flat[idx : idx + size].reshape(shape), idx + size
+
+
+def _fast_unflatten(flat, spec):
+    """Restore a nested structure from a flat array, using a precomputed
+    structure specification instead of walking a model object.
+
+    Args:
+        flat (array): 1-D array of items
+        spec (tuple, list or None): specification captured by
+            :func:`_capture_spec`
+
+    Returns:
+        Union[array, list, Any]: the elements of ``flat`` arranged into the
+        captured nested structure
+    """
+    res, _ = _unflatten_spec(flat, spec)
+    return res
+
+
+def qng_step(metric_tensor, grad, x, stepsize):
+    r"""Compute a single quantum natural gradient update in functional form,
+
+    .. math::
+
+        x^{(t+1)} = x^{(t)} - \eta g^{-1} \nabla f(x^{(t)}),
+
+    where :math:`g` is the Fubini-Study metric tensor evaluated at
+    :math:`x^{(t)}`.
+
+    Unlike :meth:`.QNGOptimizer.step`, this function carries no optimizer
+    state and contains no host-side control flow, so it can be compiled end
+    to end — for example with ``jax.jit`` — provided the metric tensor and
+    gradient are computed outside the compiled boundary:
+
+    .. code-block:: python
+
+        from pennylane.optimize.qng import qng_step
+
+        mt_fn = qml.metric_tensor(circuit)
+        grad_fn = jax.grad(circuit)
+        fast_step = jax.jit(qng_step)
+
+        for _ in range(steps):
+            params = fast_step(mt_fn(params), grad_fn(params), params, 0.01)
+
+    Args:
+        metric_tensor (tensor_like): the metric tensor :math:`g` evaluated at
+            the current parameter values
+        grad (tensor_like): the gradient of the objective function at the
+            current parameter values
+        x (tensor_like): the current parameter values :math:`x^{(t)}`
+        stepsize (float): the user-defined hyperparameter :math:`\eta`
+
+    Returns:
+        tensor_like: the new parameter values :math:`x^{(t+1)}`
+    """
+    x_flat = qml.math.reshape(x, (-1,))
+    grad_flat = qml.math.reshape(grad, (-1,))
+    update = qml.math.linalg.solve(metric_tensor, grad_flat)
+    return qml.math.reshape(x_flat - stepsize * update, qml.math.shape(x))
+
+
+def _psd_pinv(mt):
+    r"""Pseudo-inverse of a symmetric positive semidefinite matrix.
+
+    For symmetric matrices, an eigendecomposition-based pseudo-inverse is
+    roughly twice as fast as the SVD performed by ``linalg.pinv``, and
+    matches the structure the Fubini-Study metric tensor is guaranteed to
+    have. Eigenvalues below the cutoff are zeroed rather than inverted, as
+    with the singular values in the SVD-based pseudo-inverse.
+
+    Args:
+        mt (array): a square symmetric matrix
+
+    Returns:
+        array: the pseudo-inverse of ``mt``
+    """
+    w, v = eigh(mt, driver="evd", check_finite=False)
+    w = np.ascontiguousarray(w)
+
+    cutoff = np.max(np.abs(w)) * w.size * np.finfo(w.dtype).eps
+    above = np.abs(w) > cutoff
+
+    # Branchless masked reciprocal: one vectorized pass over the spectrum,
+    # with the below-cutoff eigenvalues left at zero
+    w_inv = np.reciprocal(w, where=above, out=np.zeros_like(w))
+
+    return np.einsum("ij,j,kj->ik", v, w_inv, v.conj(), optimize=True)
+
+
+def _block_slices(mt):
+    """Identify the diagonal blocks of a block-diagonal matrix.
+
+    Args:
+        mt (array): a square symmetric matrix
+
+    Returns:
+        list[tuple[int, int]]: ``(start, stop)`` index pairs delimiting the
+        smallest diagonal blocks outside of which all entries are zero
+    """
+    n = mt.shape[0]
+    nonzero = mt != 0
+    slices = []
+    start = 0
+
+    while start < n:
+        stop = start + 1
+        row = start
+
+        # Grow the block until it contains all nonzero columns of its rows
+        while row < stop:
+            cols = np.nonzero(nonzero[row])[0]
+
+            if cols.size > 0:
+                stop = max(stop, cols[-1] + 1)
+
+            row += 1
+
+        slices.append((start, stop))
+        start = stop
+
+    return slices
+
+
 class QNGOptimizer(GradientDescentOptimizer):
     r"""Optimizer with adaptive learning rate, via calculation
     of the diagonal or block-diagonal approximation to the Fubini-Study metric tensor.
@@ -156,6 +368,192 @@ class QNGOptimizer(GradientDescentOptimizer):
         self.metric_tensor = None
         self.lam = lam
 
+        # Cached factorization of the metric tensor; recomputing it on every
+        # call to ``apply_grad`` would defeat the purpose of
+        # ``recompute_tensor=False``.
+        self._mt_cho = None
+        self._mt_lu = None
+        self._mt_diag_inv = None
+        self._mt_blocks = None
+
+        # Lazily computed pseudo-inverse of the metric tensor, kept until the
+        # tensor itself is recomputed.
+        self._mt_inv = None
+
+        # LAPACK triangular-solve routine resolved for the metric tensor
+        # dtype, used together with the cached Cholesky factor.
+        self._potrs = None
+
+        # Small cache of metric tensors keyed on the QNode and parameter
+        # values, so that repeated steps at identical parameters (e.g.
+        # alternating cost-evaluation/update patterns) do not trigger a fresh
+        # round of quantum evaluations.
+        self._mt_cache = {}
+        self._mt_cache_size = 2
+
+        # Weak reference to the last objective validated in ``step_and_cost``,
+        # so the isinstance check is only performed once per objective rather
+        # than on every step of a training loop.
+        self._validated_obj_ref = None
+
+    @property
+    def metric_tensor_inv(self):
+        """array or None: pseudo-inverse of the most recently computed metric
+        tensor, or ``None`` if no metric tensor has been computed yet.
+
+        The inverse is computed on demand for inspection purposes only; the
+        optimization step solves the corresponding linear system without ever
+        forming this matrix. Once computed, the inverse is cached until the
+        metric tensor is recomputed.
+        """
+        if self.metric_tensor is None:
+            return None
+
+        if self._mt_inv is None:
+            self._mt_inv = _psd_pinv(self.metric_tensor)
+
+        return self._mt_inv
+
+    def _metric_tensor_cache_key(self, qnode, args, kwargs):
+        """Build a cache key identifying a metric tensor evaluation by the
+        QNode identity and the concrete parameter values.
+
+        The key is only valid for the metric tensor function that is
+        automatically derived from the QNode; evaluations of a user-supplied
+        ``metric_tensor_fn`` are never cached.
+
+        Args:
+            qnode (QNode): the QNode (or cost function) being optimized
+            args (tuple): positional arguments of the QNode
+            kwargs (dict): keyword arguments of the QNode
+
+        Returns:
+            tuple or None: a hashable cache key, or ``None`` if the arguments
+            cannot reliably be converted into one (in which case caching is
+            skipped)
+        """
+        values = list(args) + [kwargs[k] for k in sorted(kwargs)]
+        value_key = []
+
+        for value in values:
+            try:
+                arr = np.asarray(value)
+            except (TypeError, ValueError):
+                return None
+
+            if arr.dtype == object:
+                return None
+
+            value_key.append(arr.tobytes())
+
+        return (id(qnode), self.diag_approx, tuple(sorted(kwargs)), tuple(value_key))
+
+    def _factorize_metric_tensor(self):
+        """Cache a factorization of the current metric tensor.
+
+        If the metric tensor is diagonal — always the case under the diagonal
+        approximation — only the elementwise inverse of the diagonal is
+        stored, reducing each subsequent solve from :math:`O(n^3)` to
+        :math:`O(n)`. If the tensor is block diagonal instead, as produced by
+        the default layer-wise computation, each block is factored
+        independently, so that neither the factorization nor the solve ever
+        touches the zero blocks.
+        Otherwise, a Cholesky factorization is attempted first, since the
+        metric tensor is positive (semi)definite; if that fails, an LU
+        factorization is cached instead. The factorization is reused by every
+        subsequent call to :meth:`~.apply_grad` until the metric tensor is
+        recomputed.
+        """
+        self._mt_cho = None
+        self._mt_lu = None
+        self._mt_diag_inv = None
+        self._mt_blocks = None
+        self._mt_inv = None
+
+        diag = np.diagonal(self.metric_tensor)
+
+        if np.count_nonzero(self.metric_tensor - np.diag(diag)) == 0:
+            # Threshold the diagonal in the same spirit as the cutoff
+            # applied to singular values by the pseudo-inverse.
+            cutoff = np.max(np.abs(diag)) * diag.size * np.finfo(diag.dtype).eps
+            diag_inv = np.zeros_like(diag)
+            nonzero = np.abs(diag) > cutoff
+            diag_inv[nonzero] = 1.0 / diag[nonzero]
+            self._mt_diag_inv = diag_inv
+            return
+
+        # The LAPACK routines are called directly, skipping the per-call
+        # validation and dispatch of the scipy wrappers; the metric tensor and
+        # gradient come from trusted QNode evaluations, and the non-finite
+        # guard in ``_solve_metric_tensor`` still catches degenerate solutions.
+        mt = np.ascontiguousarray(self.metric_tensor)
+        potrf, self._potrs = get_lapack_funcs(("potrf", "potrs"), (mt,))
+
+        # The default layer-wise metric tensor is block diagonal; factoring
+        # each block separately avoids the O(n^3) cost of factoring (and
+        # solving with) the full dense matrix.
+        slices = _block_slices(mt)
+
+        if len(slices) > 1:
+            blocks = []
+
+            for start, stop in slices:
+                c, info = potrf(mt[start:stop, start:stop], lower=1)
+
+                if info != 0:
+                    # Non-positive-definite block; use the dense fallbacks
+                    blocks = None
+                    break
+
+                blocks.append((start, stop, c))
+
+            if blocks is not None:
+                self._mt_blocks = blocks
+                return
+
+        c, info = potrf(mt, lower=1)
+
+        if info == 0:
+            self._mt_cho = c
+        else:
+            self._mt_lu = lu_factor(self.metric_tensor, check_finite=False)
+
+    def _solve_metric_tensor(self, grad_flat):
+        """Solve the linear system ``metric_tensor @ update = grad_flat`` using
+        the cached factorization of the metric tensor.
+
+        Args:
+            grad_flat (array): the flattened gradient of the objective function
+
+        Returns:
+            array: the natural gradient update direction
+        """
+        factors = (self._mt_cho, self._mt_lu, self._mt_diag_inv, self._mt_blocks)
+
+        if all(factor is None for factor in factors):
+            self._factorize_metric_tensor()
+
+        if self._mt_diag_inv is not None:
+            return self._mt_diag_inv * grad_flat
+
+        if self._mt_blocks is not None:
+            update = np.empty_like(grad_flat)
+
+            for start, stop, c in self._mt_blocks:
+                update[start:stop], _ = self._potrs(c, grad_flat[start:stop], lower=1)
+        elif self._mt_cho is not None:
+            update, _ = self._potrs(self._mt_cho, grad_flat, lower=1)
+        else:
+            update = lu_solve(self._mt_lu, grad_flat, check_finite=False)
+
+        if not np.all(np.isfinite(update)):
+            # Singular metric tensor; fall back to a least-squares solution,
+            # which matches the behaviour of the pseudo-inverse on the
+            # ill-conditioned directions.
+            update = lstsq(self.metric_tensor, grad_flat)[0]
+
+        return update
+
     def step_and_cost(
         self, qnode, *args, grad_fn=None, recompute_tensor=True, metric_tensor_fn=None, **kwargs
     ):
@@ -183,19 +581,61 @@ class QNGOptimizer(GradientDescentOptimizer):
             prior to the step
         """
         # pylint: disable=arguments-differ
-        if not isinstance(qnode, (qml.QNode, qml.ExpvalCost)) and metric_tensor_fn is None:
-            raise ValueError(
-                "The objective function must either be encoded as a single QNode or "
-                "an ExpvalCost object for the natural gradient to be automatically computed. "
-                "Otherwise, metric_tensor_fn must be explicitly provided to the optimizer."
-            )
+        if metric_tensor_fn is None and (
+            self._validated_obj_ref is None or self._validated_obj_ref() is not qnode
+        ):
+            if not isinstance(qnode, (qml.QNode, qml.ExpvalCost)):
+                raise ValueError(
+                    "The objective function must either be encoded as a single QNode or "
+                    "an ExpvalCost object for the natural gradient to be automatically computed. "
+                    "Otherwise, metric_tensor_fn must be explicitly provided to the optimizer."
+                )
+
+            self._validated_obj_ref = weakref.ref(qnode)
 
         if recompute_tensor or self.metric_tensor is None:
             if metric_tensor_fn is None:
+                # The cache is only consulted for the automatically derived
+                # metric tensor function; a user-supplied ``metric_tensor_fn``
+                # may change between calls without any change in the arguments.
+                cache_key = self._metric_tensor_cache_key(qnode, args, kwargs)
                 metric_tensor_fn = qml.metric_tensor(qnode, diag_approx=self.diag_approx)
-
-            self.metric_tensor = metric_tensor_fn(*args, **kwargs)
-            self.metric_tensor += self.lam * np.identity(self.metric_tensor.shape[0])
+            else:
+                cache_key = None
+
+            if cache_key is not None and cache_key in self._mt_cache:
+                # Reuse the metric tensor (and its factorization) previously
+                # computed at identical parameter values.
+                (
+                    _,
+                    self.metric_tensor,
+                    self._mt_cho,
+                    self._mt_lu,
+                    self._mt_diag_inv,
+                    self._mt_blocks,
+                ) = self._mt_cache[cache_key]
+                self._mt_inv = None
+            else:
+                self.metric_tensor = metric_tensor_fn(*args, **kwargs)
+                self.metric_tensor += self.lam * np.identity(self.metric_tensor.shape[0])
+                self._factorize_metric_tensor()
+
+                if cache_key is not None:
+                    if len(self._mt_cache) >= self._mt_cache_size:
+                        # Evict the oldest entry
+                        self._mt_cache.pop(next(iter(self._mt_cache)))
+
+                    # The entry keeps a reference to the QNode, so the id used
+                    # in the key cannot be recycled by a new object while the
+                    # entry is alive.
+                    self._mt_cache[cache_key] = (
+                        qnode,
+                        self.metric_tensor,
+                        self._mt_cho,
+                        self._mt_lu,
+                        self._mt_diag_inv,
+                        self._mt_blocks,
+                    )
 
         g, forward = self.compute_grad(qnode, args, kwargs, grad_fn=grad_fn)
         new_args = self.apply_grad(g, args)
@@ -255,7 +695,25 @@ class QNGOptimizer(GradientDescentOptimizer):
         Returns:
             array: the new values :math:`x^{(t+1)}`
         """
-        grad_flat = np.array(list(_flatten(grad)))
-        x_flat = np.array(list(_flatten(args)))
-        x_new_flat = x_flat - self.stepsize * np.linalg.solve(self.metric_tensor, grad_flat)
-        return unflatten(x_new_flat, args)
+        if len(args) == 1 and isinstance(args[0], np.ndarray):
+            # Fast path: a single array argument requires no flattening or
+            # structural reconstruction, only a reshape. ``ravel`` returns a
+            # view whenever the array is contiguous.
+            x = args[0]
+            g = grad[0] if isinstance(grad, (list, tuple)) else grad
+            grad_flat = np.asarray(g).ravel()
+            update = self._solve_metric_tensor(grad_flat).reshape(x.shape)
+            return [x - self.stepsize * update]
+
+        # Generic path for arbitrarily nested iterables of parameters
+        grad_flat = _fast_flatten(grad)
+        x_flat = _fast_flatten(args)
+
+        # The specification is recaptured on every call: capturing walks only
+        # the shapes, never the data, while reusing a stale specification
+        # would silently rebuild the wrong structure if the arguments change
+        # shape between steps without changing their total size.
+        spec = _capture_spec(args)
+
+        x_new_flat = x_flat - self.stepsize * self._solve_metric_tensor(grad_flat)
+        return _fast_unflatten(x_new_flat, spec)
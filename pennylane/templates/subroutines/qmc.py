@@ -150,10 +150,11 @@ def _make_V(dim):
     """
     assert dim % 2 == 0, "dimension for _make_V() must be even"
 
-    one = np.array([[0, 0], [0, 1]])
     dim_without_qubit = int(dim / 2)
 
-    return 2 * np.kron(np.eye(dim_without_qubit), one) - np.eye(dim)
+    # 2 * (I (x) |1><1|) - I is diagonal, with entries alternating between
+    # -1 and 1; build it directly instead of taking the Kronecker product
+    return np.diag(np.tile(np.array([-1.0, 1.0]), dim_without_qubit))
 
 
 def _make_Z(dim):
@@ -18,6 +18,105 @@ import pennylane as qml
 from pennylane import math
 import numpy as np
 
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
+
+def _zyz_angles(U):
+    r"""Elementary kernel extracting the ZYZ ``Rot`` angles of a non-diagonal
+    :math:`2 \times 2` special unitary matrix.
+
+    This is the interface-agnostic numeric core of :func:`zyz_decomposition`.
+    It operates on plain NumPy data only, and is JIT-compiled if Numba is
+    installed.
+
+    Args:
+        U (array[complex]): A matrix in :math:`SU(2)` with a nonzero
+            off-diagonal element.
+
+    Returns:
+        tuple[float, float, float]: The angles :math:`(\phi, \theta, \omega)`
+        such that :math:`RZ(\omega) RY(\theta) RZ(\phi)` is equal to ``U`` up
+        to a global phase.
+    """
+    # If the top left element is 0, can only use the off-diagonal elements
+    if np.abs(U[0, 0]) < 1e-8:
+        phi = 0.0
+        theta = -np.pi
+        omega = (1j * np.log(U[0, 1] / U[1, 0])).real - np.pi
+    else:
+        # If not, compute the angle of the RY from the matrix element moduli
+        cos2_theta_over_2 = np.abs(U[0, 0] * U[1, 1])
+        theta = 2 * np.arccos(np.sqrt(cos2_theta_over_2))
+
+        omega = (1j * np.log(np.tan(theta / 2) * U[0, 0] / U[1, 0])).real
+        phi = -omega - 2 * np.arctan2(U[0, 0].imag, U[0, 0].real)
+
+    return phi, theta, omega
+
+
+if njit is not None:
+    _zyz_angles = njit(cache=True)(_zyz_angles)
+
+
+def _zyz_angles_batched(Us):
+    r"""Compute the ZYZ ``Rot`` angles of a batch of :math:`2 \times 2`
+    unitary matrices.
+
+    All angles are extracted with a single pass of vectorized NumPy
+    operations over the batch axes, rather than one matrix at a time.
+
+    Args:
+        Us (array[complex]): A tensor of shape ``(..., 2, 2)`` of unitary
+            matrices.
+
+    Returns:
+        array[float]: A tensor of shape ``(..., 3)`` containing the angles
+        :math:`(\phi, \theta, \omega)` such that
+        :math:`RZ(\omega) RY(\theta) RZ(\phi)` is equal to the corresponding
+        matrix up to a global phase. Diagonal matrices yield
+        :math:`(0, 0, \omega)`, with :math:`RZ(\omega)` implementing the
+        matrix.
+    """
+    Us = np.asarray(Us, dtype=np.complex128)
+
+    # Check unitarity of the full batch at once
+    prods = np.einsum("...ij,...kj->...ik", Us, Us.conj())
+    if not np.allclose(prods, np.eye(2), atol=1e-7):
+        raise ValueError("Operator must be unitary.")
+
+    # Convert to SU(2)
+    dets = Us[..., 0, 0] * Us[..., 1, 1] - Us[..., 0, 1] * Us[..., 1, 0]
+    Us = Us * np.exp(-0.5j * np.angle(dets))[..., np.newaxis, np.newaxis]
+
+    u00, u01 = Us[..., 0, 0], Us[..., 0, 1]
+    u10, u11 = Us[..., 1, 0], Us[..., 1, 1]
+
+    diagonal = np.abs(u01) < 1e-8
+    corner = np.abs(u00) < 1e-8
+
+    # ``u10`` only vanishes for diagonal matrices, whose branch does not use
+    # it; substitute a safe denominator there.
+    u10_safe = np.where(diagonal, 1.0, u10)
+
+    # All three branches are evaluated over the full batch and the relevant
+    # one is selected per matrix; invalid intermediate values in the inactive
+    # branches are discarded by the selection.
+    with np.errstate(divide="ignore", invalid="ignore"):
+        theta = 2 * np.arccos(np.clip(np.sqrt(np.abs(u00 * u11)), 0.0, 1.0))
+        omega = np.real(1j * np.log(np.tan(theta / 2) * u00 / u10_safe))
+        phi = -omega - 2 * np.angle(u00)
+
+        omega_corner = np.real(1j * np.log(u01 / u10_safe)) - np.pi
+
+    phi = np.where(diagonal | corner, 0.0, phi)
+    theta = np.where(diagonal, 0.0, np.where(corner, -np.pi, theta))
+    omega = np.where(diagonal, 2 * np.angle(u11), np.where(corner, omega_corner, omega))
+
+    return np.stack([phi, theta, omega], axis=-1)
+
 
 def _convert_to_su2(U):
     r"""Check unitarity of a matrix and convert it to :math:`SU(2)` if possible.
@@ -87,6 +186,12 @@ def zyz_decomposition(U, wire):
         omega = 2 * math.angle(U[1, 1])
         return [qml.RZ(omega, wires=wire)]
 
+    # Plain NumPy input involves no autodifferentiation or interface dispatch,
+    # so the angles can be extracted directly with the elementary kernel.
+    if isinstance(U, np.ndarray) and not isinstance(U, qml.numpy.tensor):
+        phi, theta, omega = _zyz_angles(np.ascontiguousarray(U, dtype=np.complex128))
+        return [qml.Rot(phi, theta, omega, wires=wire)]
+
     # If the top left element is 0, can only use the off-diagonal elements. We
     # have to be very careful with the math here to ensure things that get
     # multiplied together are of the correct type in the different interfaces.
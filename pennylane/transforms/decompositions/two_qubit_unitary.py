@@ -478,7 +478,9 @@ def _decomposition_3_cnots(U, wires):
     RYb = qml.RY(beta, wires=wires[0]).matrix
     RYa = qml.RY(alpha, wires=wires[0]).matrix
 
-    V_mats = [CNOT10, math.kron(RZd, RYb), CNOT01, math.kron(math.eye(2), RYa), CNOT10, SWAP]
+    # I (x) RYa is assembled as a block-diagonal placement rather than an
+    # explicit Kronecker product with the identity
+    V_mats = [CNOT10, math.kron(RZd, RYb), CNOT01, math.block_diag([RYa, RYa]), CNOT10, SWAP]
 
     V = math.convert_like(math.eye(4), U)
 
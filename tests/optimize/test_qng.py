@@ -17,6 +17,7 @@ import scipy as sp
 
 import pennylane as qml
 from pennylane import numpy as np
+from pennylane.optimize.qng import _block_slices, qng_step
 
 
 class TestExceptions:
@@ -46,6 +47,328 @@ class TestExceptions:
             opt.step(cost, params)
 
 
+class TestSolverPaths:
+    """Test the factorization and fallback paths used to apply the inverse
+    metric tensor to the gradient"""
+
+    def test_cholesky_path(self):
+        """Test that a positive-definite metric tensor is solved through the
+        cached Cholesky factorization"""
+        opt = qml.QNGOptimizer()
+        opt.metric_tensor = np.array([[2.0, 0.5], [0.5, 1.0]])
+        grad = np.array([0.1, -0.2])
+
+        update = opt._solve_metric_tensor(grad)
+
+        assert opt._mt_cho is not None
+        assert opt._mt_lu is None
+        assert np.allclose(update, np.linalg.solve(opt.metric_tensor, grad))
+
+    def test_lu_fallback_not_positive_definite(self):
+        """Test that an indefinite metric tensor falls back to the cached LU
+        factorization"""
+        opt = qml.QNGOptimizer()
+        opt.metric_tensor = np.array([[1.0, 2.0], [2.0, 1.0]])
+        grad = np.array([0.3, 0.7])
+
+        update = opt._solve_metric_tensor(grad)
+
+        assert opt._mt_cho is None
+        assert opt._mt_lu is not None
+        assert np.allclose(update, np.linalg.solve(opt.metric_tensor, grad))
+
+    def test_lstsq_fallback_singular(self):
+        """Test that a singular metric tensor yields the least-squares
+        (pseudo-inverse) solution rather than a non-finite update"""
+        opt = qml.QNGOptimizer()
+        opt.metric_tensor = np.array([[1.0, 1.0], [1.0, 1.0]])
+        grad = np.array([1.0, 1.0])
+
+        update = opt._solve_metric_tensor(grad)
+
+        assert np.all(np.isfinite(update))
+        assert np.allclose(update, np.linalg.pinv(opt.metric_tensor) @ grad)
+
+    def test_diag_approx_elementwise_inverse(self):
+        """Test that a diagonal metric tensor is applied through the
+        elementwise inverse of its diagonal, with zero entries thresholded
+        rather than inverted"""
+        opt = qml.QNGOptimizer(diag_approx=True)
+        opt.metric_tensor = np.diag([0.25, 0.0])
+        grad = np.array([1.0, 1.0])
+
+        update = opt._solve_metric_tensor(grad)
+
+        assert opt._mt_diag_inv is not None
+        assert np.allclose(update, [4.0, 0.0])
+
+    def test_block_slices(self):
+        """Test that the diagonal blocks of a block-diagonal matrix are
+        identified"""
+        A = np.array([[2.0, 0.5], [0.5, 1.0]])
+        B = np.array([[3.0, 0.2, 0.1], [0.2, 2.0, 0.3], [0.1, 0.3, 1.0]])
+        mt = sp.linalg.block_diag(A, B)
+
+        assert _block_slices(mt) == [(0, 2), (2, 5)]
+        assert _block_slices(A) == [(0, 2)]
+
+    def test_block_diagonal_solve(self):
+        """Test that a block-diagonal metric tensor is factored and solved
+        block by block"""
+        A = np.array([[2.0, 0.5], [0.5, 1.0]])
+        B = np.array([[3.0, 0.2, 0.1], [0.2, 2.0, 0.3], [0.1, 0.3, 1.0]])
+        mt = sp.linalg.block_diag(A, B)
+
+        opt = qml.QNGOptimizer()
+        opt.metric_tensor = mt
+        grad = np.array([0.1, -0.2, 0.3, 0.4, -0.5])
+
+        update = opt._solve_metric_tensor(grad)
+
+        assert opt._mt_blocks is not None
+        assert len(opt._mt_blocks) == 2
+        assert np.allclose(update, np.linalg.solve(mt, grad))
+
+    def test_factorization_reused_without_recompute(self, mocker, tol):
+        """Test that steps taken with ``recompute_tensor=False`` reuse the
+        factorization of the previously computed metric tensor"""
+        dev = qml.device("default.qubit", wires=1)
+
+        @qml.qnode(dev)
+        def circuit(params):
+            qml.RX(params[0], wires=0)
+            qml.RY(params[1], wires=0)
+            return qml.expval(qml.PauliZ(0))
+
+        var = np.array([0.011, 0.012])
+        opt = qml.QNGOptimizer(stepsize=0.01)
+
+        theta = opt.step(circuit, var)
+        mt = opt.metric_tensor
+        spy = mocker.spy(opt, "_factorize_metric_tensor")
+
+        theta_new = opt.step(circuit, theta, recompute_tensor=False)
+
+        spy.assert_not_called()
+        expected = theta - opt.stepsize * sp.linalg.pinvh(mt) @ qml.grad(circuit)(theta)
+        assert np.allclose(theta_new, expected, atol=tol, rtol=0)
+
+
+class TestFunctionalStep:
+    """Test the stateless functional update qng_step"""
+
+    def test_matches_optimizer_step(self, tol):
+        """Test that qng_step reproduces the update computed by
+        QNGOptimizer.step"""
+        dev = qml.device("default.qubit", wires=1)
+
+        @qml.qnode(dev)
+        def circuit(params):
+            qml.RX(params[0], wires=0)
+            qml.RY(params[1], wires=0)
+            return qml.expval(qml.PauliZ(0))
+
+        var = np.array([0.011, 0.012])
+        opt = qml.QNGOptimizer(stepsize=0.01)
+
+        step = opt.step(circuit, var)
+        grad = qml.grad(circuit)(var)
+        functional = qng_step(opt.metric_tensor, grad, var, opt.stepsize)
+
+        assert np.allclose(step, functional, atol=tol, rtol=0)
+
+    def test_jax_jit(self):
+        """Test that qng_step can be compiled end to end with jax.jit"""
+        jax = pytest.importorskip("jax")
+
+        mt = jax.numpy.diag(jax.numpy.array([0.25, 0.2]))
+        grad = jax.numpy.array([0.1, -0.2])
+        x = jax.numpy.array([0.011, 0.012])
+
+        step = jax.jit(qng_step)(mt, grad, x, 0.01)
+        expected = x - 0.01 * jax.numpy.linalg.solve(mt, grad)
+
+        assert np.allclose(step, expected)
+
+
+class TestMetricTensorInv:
+    """Test the metric_tensor_inv property"""
+
+    def test_none_before_first_step(self):
+        """Test that the pseudo-inverse is None before any metric tensor has
+        been computed"""
+        opt = qml.QNGOptimizer()
+        assert opt.metric_tensor_inv is None
+
+    def test_matches_pinv_on_singular_tensor(self, tol):
+        """Test that the eigendecomposition-based pseudo-inverse agrees with
+        numpy.linalg.pinv on a singular positive-semidefinite tensor"""
+        opt = qml.QNGOptimizer()
+        opt.metric_tensor = np.array([[1.0, 1.0], [1.0, 1.0]])
+
+        res = opt.metric_tensor_inv
+        expected = np.linalg.pinv(opt.metric_tensor)
+
+        assert np.allclose(res, expected, atol=tol, rtol=0)
+
+    def test_inverse_cached_until_recompute(self, tol):
+        """Test that repeated accesses reuse the cached inverse, and that
+        recomputing the metric tensor invalidates it"""
+        dev = qml.device("default.qubit", wires=1)
+
+        @qml.qnode(dev)
+        def circuit(params):
+            qml.RX(params[0], wires=0)
+            qml.RY(params[1], wires=0)
+            return qml.expval(qml.PauliZ(0))
+
+        var = np.array([0.011, 0.012])
+        opt = qml.QNGOptimizer(stepsize=0.01)
+
+        theta = opt.step(circuit, var)
+        inv1 = opt.metric_tensor_inv
+        assert opt.metric_tensor_inv is inv1
+
+        opt.step(circuit, theta)
+        inv2 = opt.metric_tensor_inv
+
+        assert inv2 is not inv1
+        assert np.allclose(inv2, np.linalg.pinv(opt.metric_tensor), atol=tol, rtol=0)
+
+
+class TestMetricTensorCache:
+    """Test the memoization of metric tensors on the QNode and parameter values"""
+
+    @staticmethod
+    def make_circuit():
+        """Return a simple two-parameter QNode"""
+        dev = qml.device("default.qubit", wires=1)
+
+        @qml.qnode(dev)
+        def circuit(params):
+            qml.RX(params[0], wires=0)
+            qml.RY(params[1], wires=0)
+            return qml.expval(qml.PauliZ(0))
+
+        return circuit
+
+    @staticmethod
+    def counting_metric_tensor(calls):
+        """Wrap ``qml.metric_tensor`` so that evaluations of the returned
+        metric tensor function are recorded in ``calls``"""
+        orig = qml.metric_tensor
+
+        def patched(*t_args, **t_kwargs):
+            fn = orig(*t_args, **t_kwargs)
+
+            def wrapper(*args, **kwargs):
+                calls.append(args)
+                return fn(*args, **kwargs)
+
+            return wrapper
+
+        return patched
+
+    def test_cache_hit_at_identical_parameters(self, monkeypatch, tol):
+        """Test that repeated steps at identical parameter values evaluate
+        the metric tensor only once"""
+        circuit = self.make_circuit()
+        var = np.array([0.011, 0.012])
+        opt = qml.QNGOptimizer(stepsize=0.01)
+
+        calls = []
+        monkeypatch.setattr(qml, "metric_tensor", self.counting_metric_tensor(calls))
+
+        step1 = opt.step(circuit, var)
+        step2 = opt.step(circuit, var)
+
+        assert len(calls) == 1
+        assert np.allclose(step1, step2, atol=tol, rtol=0)
+
+    def test_cache_miss_at_new_parameters(self, monkeypatch):
+        """Test that a step at new parameter values evaluates the metric
+        tensor again"""
+        circuit = self.make_circuit()
+        var = np.array([0.011, 0.012])
+        opt = qml.QNGOptimizer(stepsize=0.01)
+
+        calls = []
+        monkeypatch.setattr(qml, "metric_tensor", self.counting_metric_tensor(calls))
+
+        opt.step(circuit, var)
+        opt.step(circuit, var + 0.05)
+
+        assert len(calls) == 2
+
+    def test_cache_eviction(self, monkeypatch):
+        """Test that the cache evicts its oldest entry once full, so a step
+        at evicted parameter values triggers a fresh evaluation"""
+        circuit = self.make_circuit()
+        var = np.array([0.011, 0.012])
+        opt = qml.QNGOptimizer(stepsize=0.01)
+
+        calls = []
+        monkeypatch.setattr(qml, "metric_tensor", self.counting_metric_tensor(calls))
+
+        for shift in (0.0, 0.05, 0.1):
+            opt.step(circuit, var + shift)
+
+        assert len(opt._mt_cache) == opt._mt_cache_size
+
+        opt.step(circuit, var)
+        assert len(calls) == 4
+
+    def test_cache_entry_pins_qnode(self):
+        """Test that each cache entry keeps a reference to its QNode, so the
+        id used in the key cannot be recycled after garbage collection"""
+        circuit = self.make_circuit()
+        var = np.array([0.011, 0.012])
+        opt = qml.QNGOptimizer(stepsize=0.01)
+
+        opt.step(circuit, var)
+
+        entry = next(iter(opt._mt_cache.values()))
+        assert entry[0] is circuit
+
+    def test_user_metric_tensor_fn_not_cached(self):
+        """Test that a user-supplied metric_tensor_fn is re-evaluated on
+        every step, since it may change independently of the arguments"""
+        circuit = self.make_circuit()
+        var = np.array([0.011, 0.012])
+        opt = qml.QNGOptimizer(stepsize=0.01)
+
+        calls = []
+
+        def metric_tensor_fn(params):
+            calls.append(params)
+            return np.diag([0.25, 0.25])
+
+        opt.step(circuit, var, metric_tensor_fn=metric_tensor_fn)
+        opt.step(circuit, var, metric_tensor_fn=metric_tensor_fn)
+
+        assert len(calls) == 2
+        assert len(opt._mt_cache) == 0
+
+    def test_cache_key_matches_on_values(self):
+        """Test that cache keys compare equal exactly when the parameter
+        values do"""
+        opt = qml.QNGOptimizer()
+
+        key1 = opt._metric_tensor_cache_key(None, (np.array([1.0, 2.0]),), {})
+        key2 = opt._metric_tensor_cache_key(None, (np.array([1.0, 2.0]),), {})
+        key3 = opt._metric_tensor_cache_key(None, (np.array([1.0, 2.5]),), {})
+
+        assert key1 == key2
+        assert key1 != key3
+
+    def test_cache_key_none_for_object_arguments(self):
+        """Test that no cache key is built when the arguments cannot be
+        reliably hashed by value, bypassing the cache"""
+        opt = qml.QNGOptimizer()
+        key = opt._metric_tensor_cache_key(None, ([[1.0], [1.0, 2.0]],), {})
+        assert key is None
+
+
 class TestOptimize:
     """Test basic optimization integration"""
 
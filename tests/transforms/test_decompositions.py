@@ -24,6 +24,7 @@ from pennylane.wires import Wires
 
 from pennylane.transforms.decompositions import zyz_decomposition
 from pennylane.transforms.decompositions import two_qubit_decomposition
+from pennylane.transforms.decompositions.single_qubit_unitary import _zyz_angles_batched
 from pennylane.transforms.decompositions.two_qubit_unitary import (
     _convert_to_su4,
     _su2su2_to_tensor_products,
@@ -33,6 +34,14 @@ from pennylane.transforms.decompositions.two_qubit_unitary import (
 from test_optimization.utils import compute_matrix_from_ops_two_qubit, check_matrix_equivalence
 from gate_data import I, Z, S, T, H, X, CNOT, SWAP
 
+
+def _stack_to_numpy(params):
+    """Convert a list of framework scalars to a single NumPy array using one
+    framework-native stack and conversion, rather than unwrapping the entries
+    one at a time."""
+    return qml.math.toarray(qml.math.stack(params))
+
+
 single_qubit_decomps = [
     # First set of gates are diagonal and converted to RZ
     (I, qml.RZ, [0.0]),
@@ -80,6 +89,26 @@ class TestQubitUnitaryZYZDecomposition:
 
         assert check_matrix_equivalence(obtained_mat, U)
 
+    def test_zyz_angles_batched(self):
+        """Test that the batched angle extraction reproduces the expected
+        angles for the full set of test matrices in a single call."""
+        Us = np.stack([np.array(U, dtype=complex) for (U, _, _) in single_qubit_decomps])
+
+        obtained_angles = _zyz_angles_batched(Us)
+
+        for angles, (_, expected_gate, expected_params) in zip(
+            obtained_angles, single_qubit_decomps
+        ):
+            if expected_gate is qml.RZ:
+                assert qml.math.allclose(angles, [0.0, 0.0, expected_params[0]])
+            else:
+                assert qml.math.allclose(angles, expected_params)
+
+    def test_zyz_angles_batched_invalid_input(self):
+        """Test that the batched angle extraction rejects non-unitary input."""
+        with pytest.raises(ValueError, match="Operator must be unitary"):
+            _zyz_angles_batched(np.stack([np.array(I), np.array(I + H)]))
+
     @pytest.mark.parametrize("U,expected_gate,expected_params", single_qubit_decomps)
     def test_zyz_decomposition_torch(self, U, expected_gate, expected_params):
         """Test that a one-qubit operation in Torch is correctly decomposed."""
@@ -92,7 +121,7 @@ class TestQubitUnitaryZYZDecomposition:
         assert len(obtained_gates) == 1
         assert isinstance(obtained_gates[0], expected_gate)
         assert obtained_gates[0].wires == Wires("a")
-        assert qml.math.allclose(qml.math.unwrap(obtained_gates[0].parameters), expected_params)
+        assert qml.math.allclose(_stack_to_numpy(obtained_gates[0].parameters), expected_params)
 
         if obtained_gates[0].num_params == 1:
             obtained_mat = qml.RZ(obtained_gates[0].parameters[0], wires=0).matrix
@@ -113,7 +142,7 @@ class TestQubitUnitaryZYZDecomposition:
         assert len(obtained_gates) == 1
         assert isinstance(obtained_gates[0], expected_gate)
         assert obtained_gates[0].wires == Wires("a")
-        assert qml.math.allclose(qml.math.unwrap(obtained_gates[0].parameters), expected_params)
+        assert qml.math.allclose(_stack_to_numpy(obtained_gates[0].parameters), expected_params)
 
         print(qml.math.unwrap(obtained_gates[0].parameters))
         print(expected_params)
@@ -145,7 +174,7 @@ class TestQubitUnitaryZYZDecomposition:
         assert isinstance(obtained_gates[0], expected_gate)
         assert obtained_gates[0].wires == Wires("a")
 
-        assert qml.math.allclose(qml.math.unwrap(obtained_gates[0].parameters), expected_params)
+        assert qml.math.allclose(_stack_to_numpy(obtained_gates[0].parameters), expected_params)
 
         if obtained_gates[0].num_params == 1:
             obtained_mat = qml.RZ(obtained_gates[0].parameters[0], wires=0).matrix
@@ -47,10 +47,17 @@ def compute_matrix_from_ops_two_qubit(ops, wire_order):
             else:
                 op_mat = qml.math.unwrap(op.matrix)
 
+            # Embed the single-qubit matrix directly rather than materializing
+            # an explicit Kronecker product with the identity.
+            tensor_prod = np.zeros((4, 4), dtype=complex)
             if op_wires[0] == wire_order[0]:
-                tensor_prod = np.kron(op_mat, I)
+                # op_mat (x) I scatters op_mat over the even and odd strides
+                tensor_prod[::2, ::2] = op_mat
+                tensor_prod[1::2, 1::2] = op_mat
             else:
-                tensor_prod = np.kron(I, op_mat)
+                # I (x) op_mat places op_mat on the diagonal blocks
+                tensor_prod[:2, :2] = op_mat
+                tensor_prod[2:, 2:] = op_mat
 
             mat = np.dot(tensor_prod, mat)
 